@@ -1,16 +1,16 @@
 """
-app/app.py
-----------
+app/main.py
+-----------
 Flask dashboard — reads from PostgreSQL via queries.py and renders HTML.
-Start with: python app/app.py → http://localhost:5000
+Pages are served from render_cache, keyed on the pipeline watermark.
+Start with: python -m app.main → http://localhost:5000
+
+Production: gunicorn -c gunicorn.conf.py app.main:app
 """
 
-import os
-import sys
-from app import queries
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from flask import Flask
 
-from flask import Flask, render_template
+from app import queries, render_cache
 
 
 app = Flask(__name__)
@@ -18,23 +18,35 @@ app = Flask(__name__)
 
 @app.route("/")
 def dashboard():
-    return render_template("index.html",
-        stats          = queries.summary_stats(),
-        top_rated      = queries.top_rated(10),
-        most_popular   = queries.most_popular(10),
-        type_breakdown = queries.type_breakdown(),
-        health         = queries.pipeline_health(),
-    )
+    return render_cache.get("index")
 
 
 @app.route("/top")
 def top():
-    return render_template("top.html", anime=queries.top_rated(50))
+    return render_cache.get("top")
 
 
 @app.route("/popular")
 def popular():
-    return render_template("popular.html", anime=queries.most_popular(50))
+    return render_cache.get("popular")
+
+
+@app.route("/healthz")
+def healthz():
+    """Liveness — the process is up. Never touches the database."""
+    return {"status": "ok"}
+
+
+@app.route("/readyz")
+def readyz():
+    """Readiness — the database answers a trivial query."""
+    try:
+        queries.ping()
+    except Exception as e:
+        # Details (host, port, user) stay in the server log, not the response
+        app.logger.warning(f"Readiness check failed: {e}")
+        return {"status": "unavailable"}, 503
+    return {"status": "ready"}
 
 
 if __name__ == "__main__":
@@ -9,8 +9,38 @@ Decoupled from Flask so the same functions work in notebooks or tests.
 from sqlalchemy import create_engine, text
 import config
 
+_engine = None
+
+
 def _get_engine():
-    return create_engine(config.DB_URL)
+    """Returns the process-wide engine; its connection pool is built once."""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            config.DB_URL,
+            pool_size     = config.DB_POOL_SIZE,
+            max_overflow  = config.DB_MAX_OVERFLOW,
+            pool_pre_ping = True,   # drop connections Postgres has closed
+        )
+    return _engine
+
+
+def init_engine():
+    """
+    Builds the engine and opens one pooled connection up front.
+    Called once per worker after fork (see gunicorn.conf.py) so the
+    first request doesn't pay for connecting.
+    """
+    with _get_engine().connect():
+        pass
+
+
+def dispose_engine():
+    """Closes every pooled connection. Called on worker shutdown."""
+    global _engine
+    if _engine is not None:
+        _engine.dispose()
+        _engine = None
 
 def _query(sql: str, params: dict = None) -> list[dict]:
     """Runs a SQL query and returns rows as a list of dicts."""
@@ -21,6 +51,11 @@ def _query(sql: str, params: dict = None) -> list[dict]:
         return [dict(zip(cols, row)) for row in result.fetchall()]
 
 
+def ping() -> bool:
+    """Cheap readiness check — no table access."""
+    return _query("SELECT 1 AS ok")[0]["ok"] == 1
+
+
 def summary_stats() -> dict:
     result = _query("""
         SELECT
@@ -65,3 +100,76 @@ def pipeline_health() -> dict:
         "watermark": watermark[0] if watermark else {},
         "quality":   quality[0]   if quality   else {},
     }
+
+
+def watermark_key() -> str | None:
+    """
+    Returns a filesystem-safe key for the current watermark, or None if the
+    pipeline has never run. Used by render_cache to key rendered pages.
+    """
+    result = _query(
+        "SELECT last_run_at FROM watermark WHERE pipeline = 'anime_etl'"
+    )
+    if not result or result[0]["last_run_at"] is None:
+        return None
+    return result[0]["last_run_at"].strftime("%Y%m%dT%H%M%S%f")
+
+
+# ── Data Quality ──────────────────────────────────────────────────────────────
+def rejection_trend(reason: str = None, runs: int = 30) -> list[dict]:
+    """
+    Rejected-record counts per reason code for each of the last `runs`
+    pipeline runs, oldest first. Pass `reason` to follow a single code.
+    Every run is listed — with 0 where a code didn't occur, or a single
+    (run_at, None, 0) row if no run in the window rejected anything.
+    """
+    # @> lets the GIN index on reasons pick the rows; the WHERE keeps only that code
+    row_filter  = "AND ra.reasons @> ARRAY[CAST(:reason AS TEXT)]" if reason else ""
+    code_filter = "AND code = :reason" if reason else ""
+    codes       = "SELECT CAST(:reason AS TEXT) AS code" if reason else "SELECT DISTINCT code FROM counts"
+    return _query(f"""
+        WITH recent AS (
+            SELECT id, run_at FROM quality_log ORDER BY run_at DESC LIMIT :runs
+        ),
+        counts AS (
+            SELECT ra.quality_log_id, code, COUNT(*) AS rejected
+            FROM rejected_anime ra
+            CROSS JOIN LATERAL unnest(ra.reasons) AS code
+            WHERE ra.quality_log_id IN (SELECT id FROM recent) {row_filter} {code_filter}
+            GROUP BY ra.quality_log_id, code
+        ),
+        codes AS ({codes})
+        SELECT r.run_at, c.code AS reason, COALESCE(n.rejected, 0) AS rejected
+        FROM recent r
+        LEFT JOIN codes c  ON TRUE
+        LEFT JOIN counts n ON n.quality_log_id = r.id AND n.code = c.code
+        ORDER BY r.run_at, c.code
+    """, {"runs": runs, "reason": reason})
+
+
+def rejection_totals(runs: int = 30) -> list[dict]:
+    """Rejected-record counts per reason code across the last `runs` runs."""
+    return _query("""
+        WITH recent AS (
+            SELECT id FROM quality_log ORDER BY run_at DESC LIMIT :runs
+        )
+        SELECT code AS reason, COUNT(*) AS rejected,
+               COUNT(DISTINCT ra.quality_log_id) AS runs_affected
+        FROM recent r
+        JOIN rejected_anime ra ON ra.quality_log_id = r.id
+        CROSS JOIN LATERAL unnest(ra.reasons) AS code
+        GROUP BY code ORDER BY rejected DESC
+    """, {"runs": runs})
+
+
+def rejected_records(reason: str, limit: int = 50) -> list[dict]:
+    """Most recently rejected records carrying the given reason code."""
+    return _query("""
+        SELECT ql.run_at, ra.anime_id, ra.title, ra.score, ra.rank,
+               ra.reasons, ra.rejection_reason, ra.url
+        FROM rejected_anime ra
+        JOIN quality_log ql ON ql.id = ra.quality_log_id
+        WHERE ra.reasons @> ARRAY[CAST(:reason AS TEXT)]
+        ORDER BY ra.id DESC
+        LIMIT :limit
+    """, {"reason": reason, "limit": limit})
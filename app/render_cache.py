@@ -0,0 +1,135 @@
+"""
+app/render_cache.py
+--------------------
+Fully rendered dashboard pages, keyed on the pipeline watermark.
+
+The data only changes when the loader runs, so each page only needs to be
+rendered once per watermark. Lookup order on every request:
+
+  1. in-process dict                          (per Flask worker)
+  2. RENDER_CACHE_DIR/<watermark>/<page>.html (shared with the loader)
+  3. render + store                           (cold miss)
+
+loader.run() calls warm() right after update_watermark(), so in practice
+requests only ever hit 1 or 2 and Jinja never runs on the request path.
+"""
+
+import os
+import shutil
+import tempfile
+from flask import current_app, render_template
+
+import config
+from app import queries
+
+
+# page name → (template, context builder)
+PAGES = {
+    "index": ("index.html", lambda: {
+        "stats":          queries.summary_stats(),
+        "top_rated":      queries.top_rated(10),
+        "most_popular":   queries.most_popular(10),
+        "type_breakdown": queries.type_breakdown(),
+        "health":         queries.pipeline_health(),
+    }),
+    "top":     ("top.html",     lambda: {"anime": queries.top_rated(50)}),
+    "popular": ("popular.html", lambda: {"anime": queries.most_popular(50)}),
+}
+
+# Where each page lands under RENDER_STATIC_DIR, matching the Flask routes
+STATIC_PATHS = {
+    "index":   "index.html",
+    "top":     os.path.join("top", "index.html"),
+    "popular": os.path.join("popular", "index.html"),
+}
+
+# page name → (watermark key, html). Only the latest watermark is kept.
+_memory: dict[str, tuple[str, str]] = {}
+
+
+def render(page: str) -> str:
+    """Queries the data for a page and renders it. Needs an app context."""
+    template, build_context = PAGES[page]
+    return render_template(template, **build_context())
+
+
+def _cache_path(key: str, page: str) -> str:
+    return os.path.join(config.RENDER_CACHE_DIR, key, f"{page}.html")
+
+
+def _write(path: str, html: str):
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    # Own temp file per writer — several threads/workers may fill the same
+    # page at once. Same directory, so os.replace stays an atomic rename.
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(html)
+        os.chmod(tmp, 0o644)   # mkstemp creates 0600; a web server must read it
+        os.replace(tmp, path)  # atomic — readers never see a half-written page
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _prune(keep: str):
+    """Removes rendered pages for every watermark except `keep`."""
+    if not os.path.isdir(config.RENDER_CACHE_DIR):
+        return
+    for name in os.listdir(config.RENDER_CACHE_DIR):
+        if name != keep:
+            shutil.rmtree(os.path.join(config.RENDER_CACHE_DIR, name), ignore_errors=True)
+
+
+def get(page: str) -> str:
+    """Returns the rendered HTML for `page` at the current watermark."""
+    key = queries.watermark_key()
+    if key is None:
+        return render(page)  # pipeline has never run — nothing to key on
+
+    cached = _memory.get(page)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    path = _cache_path(key, page)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            html = f.read()
+    except FileNotFoundError:  # cold miss, or pruned by a newer warm()
+        html = render(page)
+        if queries.watermark_key() != key:
+            # A load finished mid-render and warm() pruned `key` — writing would
+            # recreate its directory. Serve the page without caching it.
+            return html
+        try:
+            _write(path, html)
+        except OSError as e:
+            # The page is rendered — serve it even if the disk cache can't be filled
+            current_app.logger.warning(f"render_cache: could not write {path}: {e}")
+
+    _memory[page] = (key, html)
+    return html
+
+
+def warm(app, static_dir: str = None) -> str | None:
+    """
+    Renders every page for the current watermark into RENDER_CACHE_DIR.
+    If static_dir is given, also writes the pages there as plain static
+    files a web server can serve directly. Returns the watermark key.
+    """
+    with app.app_context():
+        key = queries.watermark_key()
+        if key is None:
+            return None
+
+        for page in PAGES:
+            html = render(page)
+            _write(_cache_path(key, page), html)
+            if static_dir:
+                _write(os.path.join(static_dir, STATIC_PATHS[page]), html)
+
+    _prune(keep=key)
+    return key
@@ -16,6 +16,10 @@ DB_PASSWORD = os.getenv("DB_PASSWORD", "postgres")
 
 DB_URL = f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
+# Max time a migration waits for a table lock before giving up (retried next
+# run) — keeps DDL from queueing up the dashboard's reads behind it
+MIGRATION_LOCK_TIMEOUT = os.getenv("MIGRATION_LOCK_TIMEOUT", "5s")
+
 
 # ── API Configuration ────────────────────────────────────────────────────────
 JIKAN_BASE_URL = "https://api.jikan.moe/v4/anime"
@@ -32,4 +36,30 @@ MIN_RANK  = 1
 
 # ── Paths ───────────────────────────────────────────────────────────────────
 BASE_DIR = os.path.dirname(__file__)
-RAW_DIR  = os.path.join(BASE_DIR, "data", "raw")
\ No newline at end of file
+RAW_DIR  = os.path.join(BASE_DIR, "data", "raw")
+
+
+# ── Render Cache ────────────────────────────────────────────────────────────
+# Rendered dashboard pages, keyed on the watermark. Shared by the loader
+# (which warms it) and the Flask app (which serves from it).
+RENDER_CACHE_DIR = os.getenv("RENDER_CACHE_DIR", os.path.join(BASE_DIR, "data", "rendered"))
+
+# Optional: also write the latest pages here as plain static files
+# (index.html, top/index.html, popular/index.html) for nginx etc.
+RENDER_STATIC_DIR = os.getenv("RENDER_STATIC_DIR")
+
+
+
+# ── Web Server (gunicorn.conf.py) ───────────────────────────────────────────
+WEB_BIND             = os.getenv("WEB_BIND", "0.0.0.0:5000")
+# Capped: os.cpu_count() is the host's, not the container's, and every
+# worker holds its own DB pool against Postgres' max_connections (100),
+# which is shared with Airflow
+WEB_WORKERS          = int(os.getenv("WEB_WORKERS", str(min((os.cpu_count() or 1) * 2 + 1, 4))))
+WEB_THREADS          = int(os.getenv("WEB_THREADS", "4"))
+WEB_TIMEOUT          = int(os.getenv("WEB_TIMEOUT", "30"))
+WEB_GRACEFUL_TIMEOUT = int(os.getenv("WEB_GRACEFUL_TIMEOUT", "30"))
+
+# Connection pool per dashboard worker — one connection per thread, no overflow
+DB_POOL_SIZE    = int(os.getenv("DB_POOL_SIZE", str(WEB_THREADS)))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "0"))
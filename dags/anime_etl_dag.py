@@ -14,15 +14,16 @@ How it works:
   - You can also trigger a manual run from the Airflow UI.
 
 To monitor: http://localhost:8080  (admin / admin)
+
+Keep this file cheap to import — the scheduler re-parses it constantly.
+Pipeline modules (and pandas/sqlalchemy/requests behind them) are only
+imported inside the task callables. The project root is on PYTHONPATH
+(see docker-compose.yml), so no sys.path changes are needed here.
 """
 
 from airflow import DAG
 from airflow.operators.python import PythonOperator
 from datetime import datetime, timedelta
-import sys
-
-# The project root is mounted at /opt/airflow in Docker
-sys.path.insert(0, "/opt/airflow")
 
 
 # ── Default settings applied to all tasks ────────────────────────────────────
@@ -0,0 +1,49 @@
+"""
+gunicorn.conf.py
+-----------------
+Production server for the Flask dashboard.
+Start with: gunicorn -c gunicorn.conf.py app.main:app
+
+- Threaded workers (gthread): WEB_WORKERS processes × WEB_THREADS threads.
+- The app is imported once in the master (preload_app), then each worker
+  builds its own DB connection pool after fork — pools are never shared
+  across processes.
+- SIGTERM drains in-flight requests for up to WEB_GRACEFUL_TIMEOUT seconds
+  before workers exit and close their connections.
+
+Postgres connections (max_connections defaults to 100, shared with Airflow):
+  worst case per container = WEB_WORKERS × (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+  defaults                 = 4 × (4 + 0) = 16
+Raise WEB_WORKERS / WEB_THREADS only with that budget in mind.
+"""
+
+# Every module-level name here is read as a gunicorn setting, and "config"
+# is one of them — so the project config is imported under another name
+import config as settings
+
+bind             = settings.WEB_BIND
+workers          = settings.WEB_WORKERS
+threads          = settings.WEB_THREADS
+worker_class     = "gthread"
+preload_app      = True
+timeout          = settings.WEB_TIMEOUT
+graceful_timeout = settings.WEB_GRACEFUL_TIMEOUT
+keepalive        = 5
+
+accesslog = "-"
+errorlog  = "-"
+
+
+def post_fork(server, worker):
+    from app import queries
+    queries.dispose_engine()  # never inherit a pool from the master
+    try:
+        queries.init_engine()
+    except Exception as e:
+        # Don't crash-loop if Postgres isn't up yet; /readyz reports it
+        server.log.warning(f"Worker {worker.pid}: DB pool warm-up failed: {e}")
+
+
+def worker_exit(server, worker):
+    from app import queries
+    queries.dispose_engine()
@@ -4,38 +4,40 @@ pipeline/loader.py
 Step 3 of the ETL pipeline.
 
 Features:
-- Creates schema if not exists
+- Applies pending schema migrations
 - Bulk upsert (no duplicates ever)
-- Logs quality metrics
+- Logs quality metrics + stores rejected records
 - Updates watermark
+- Warms the dashboard render cache
 - Fully Jikan API compatible
 """
 
+from __future__ import annotations
+
 import os
-import sys
 import json
-import pandas as pd
 from datetime import datetime, UTC
-from sqlalchemy import create_engine, text
+from typing import TYPE_CHECKING
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import config
 
+# pandas / sqlalchemy are imported inside the functions that use them,
+# so importing this module (e.g. from the DAG file) stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # ── Schema Setup ──────────────────────────────────────────────────────────────
 def create_schema(engine):
-    schema_path = os.path.join(os.path.dirname(__file__), "..", "sql", "schema.sql")
+    """Applies pending migrations from sql/migrations (see pipeline/migrations.py)."""
+    from pipeline import migrations
 
-    with open(schema_path, "r") as f:
-        sql = f.read()
+    applied = migrations.migrate(engine)
 
-    with engine.begin() as conn:  # auto commit transaction
-        for statement in sql.split(";"):
-            statement = statement.strip()
-            if statement:
-                conn.execute(text(statement))
-
-    print("[loader] Schema and indexes ready.")
+    if applied:
+        print(f"[loader] Schema migrated: {', '.join(applied)}.")
+    else:
+        print("[loader] Schema up to date.")
 
 
 # ── Upsert (Bulk + Idempotent) ────────────────────────────────────────────────
@@ -59,6 +61,9 @@ def upsert_anime(clean_df: pd.DataFrame, engine) -> int:
         print("[loader] No clean records to load.")
         return 0
 
+    import pandas as pd
+    from sqlalchemy import text
+
     # Ensure URL column exists (Jikan safe)
     if "url" not in clean_df.columns:
         clean_df["url"] = None
@@ -77,35 +82,95 @@ def upsert_anime(clean_df: pd.DataFrame, engine) -> int:
 
 
 # ── Quality Log ───────────────────────────────────────────────────────────────
+REJECTED_COLUMNS = [
+    "anime_id", "rank", "title", "type", "episodes",
+    "score", "members", "url", "scraped_at", "rejection_reason",
+]
+
+
+def reason_codes(rejected_df: pd.DataFrame) -> pd.Series:
+    """
+    Splits each "reason, reason" string into a list of reason codes.
+    Detail in parentheses is dropped: "score_out_of_range(11.5)" → "score_out_of_range".
+    A missing or empty reason gives an empty list.
+    """
+    import pandas as pd
+
+    if rejected_df.empty or "rejection_reason" not in rejected_df.columns:
+        return pd.Series([[]] * len(rejected_df), index=rejected_df.index, dtype=object)
+
+    return (
+        rejected_df["rejection_reason"]
+        .fillna("")
+        .astype(str)
+        .str.replace(r"\([^)]*\)", "", regex=True)
+        .str.split(", ")
+        .map(lambda codes: [c for c in codes if c])  # "" / null reason → []
+    )
+
+
+def reason_counts(codes: pd.Series) -> dict:
+    """{reason code: rejected records} for the failure_reasons JSON."""
+    counts = codes.explode().dropna().value_counts()
+    return {code: int(n) for code, n in counts.items()}  # numpy ints → int
+
+
+def insert_rejected(rejected_df: pd.DataFrame, codes: pd.Series, quality_log_id: int, conn) -> int:
+    """Bulk-inserts rejected records, tagged with their run and reason codes."""
+    import pandas as pd
+    from sqlalchemy import column, insert, table
+
+    if rejected_df.empty:
+        return 0
+
+    rows = rejected_df.reindex(columns=REJECTED_COLUMNS).astype(object)
+    rows = rows.where(pd.notnull(rows), None)
+    rows["reasons"]        = codes.to_numpy()
+    rows["quality_log_id"] = quality_log_id
+
+    # A Core insert() (not text()) so SQLAlchemy batches the executemany
+    # into multi-row INSERT ... VALUES statements
+    rejected_anime = table("rejected_anime", *(column(c) for c in rows.columns))
+    records = rows.to_dict(orient="records")
+    conn.execute(insert(rejected_anime), records)
+
+    return len(records)
+
+
 def log_quality(clean_df: pd.DataFrame, rejected_df: pd.DataFrame, engine):
+    import pandas as pd
+    from sqlalchemy import text
+
     rejected_df = rejected_df if rejected_df is not None else pd.DataFrame()
 
     total  = len(clean_df) + len(rejected_df)
     passed = len(clean_df)
     failed = len(rejected_df)
 
-    reasons = {}
-    if not rejected_df.empty and "rejection_reason" in rejected_df.columns:
-        for reason in rejected_df["rejection_reason"]:
-            for r in str(reason).split(", "):
-                reasons[r] = reasons.get(r, 0) + 1
+    codes   = reason_codes(rejected_df)
+    reasons = reason_counts(codes)
 
     with engine.begin() as conn:
-        conn.execute(text("""
+        quality_log_id = conn.execute(text("""
             INSERT INTO quality_log (run_at, total_scraped, passed, failed, failure_reasons)
             VALUES (NOW(), :total, :passed, :failed, :reasons)
+            RETURNING id
         """), {
             "total":   total,
             "passed":  passed,
             "failed":  failed,
             "reasons": json.dumps(reasons),
-        })
+        }).scalar_one()
+
+        stored = insert_rejected(rejected_df, codes, quality_log_id, conn)
 
-    print(f"[loader] Quality log: {passed}/{total} passed ({failed} rejected).")
+    print(f"[loader] Quality log: {passed}/{total} passed ({failed} rejected, {stored} stored).")
 
 
 # ── Watermark ─────────────────────────────────────────────────────────────────
 def update_watermark(records_fetched: int, records_loaded: int, engine):
+    from sqlalchemy import text
+
     with engine.begin() as conn:
         conn.execute(text("""
             INSERT INTO watermark (pipeline, last_run_at, records_fetched, records_loaded)
@@ -122,8 +187,27 @@ def update_watermark(records_fetched: int, records_loaded: int, engine):
     print(f"[loader] Watermark updated at {datetime.now(UTC).isoformat()}")
 
 
+# ── Render Cache ──────────────────────────────────────────────────────────────
+def warm_render_cache():
+    """
+    Pre-renders the dashboard pages for the new watermark so the Flask app
+    never renders on the request path. A failure here must not fail the load.
+    """
+    try:
+        from app.main import app
+        from app import render_cache
+
+        key = render_cache.warm(app, static_dir=config.RENDER_STATIC_DIR)
+        print(f"[loader] Render cache warmed for watermark {key}.")
+    except Exception as e:
+        print(f"[loader] Render cache warm failed: {e}")
+
+
 # ── Main Entry ────────────────────────────────────────────────────────────────
 def run(clean_df: pd.DataFrame = None, rejected_df: pd.DataFrame = None):
+    import pandas as pd
+    from sqlalchemy import create_engine
+
     engine = create_engine(config.DB_URL)
 
     # Ensure schema exists
@@ -155,6 +239,9 @@ def run(clean_df: pd.DataFrame = None, rejected_df: pd.DataFrame = None):
         engine=engine
     )
 
+    # Pre-render dashboard pages for the new watermark
+    warm_render_cache()
+
 
 if __name__ == "__main__":
     run()
\ No newline at end of file
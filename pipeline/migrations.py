@@ -0,0 +1,237 @@
+"""
+pipeline/migrations.py
+-----------------------
+Versioned schema migrations, run by loader.create_schema() on every load.
+
+- Migrations live in sql/migrations/NNNN_name.sql and run in filename order.
+- Applied versions are recorded in the schema_migrations table; when
+  nothing is pending the only cost is one SELECT on that table.
+- A file containing CONCURRENTLY (e.g. CREATE INDEX CONCURRENTLY) runs
+  outside a transaction, one statement at a time, so index builds never
+  block writes or the dashboard's reads. Every other file runs in a
+  single transaction.
+- A Postgres advisory lock stops two loads from migrating at once, and
+  lock_timeout stops DDL from queueing reads behind it for long.
+"""
+
+import os
+import re
+
+import config
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(__file__), "..", "sql", "migrations")
+
+# Arbitrary key for pg_advisory_lock — shared by every migration runner
+ADVISORY_LOCK_ID = 7_241_801
+
+_FILENAME     = re.compile(r"^(\d+)_[\w-]+\.sql$")
+_DOLLAR_TAG   = re.compile(r"\$[A-Za-z_]\w*\$|\$\$")
+_CONCURRENTLY = re.compile(r"\bCONCURRENTLY\b", re.IGNORECASE)
+_CONCURRENT_INDEX = re.compile(
+    r'^CREATE\s+(?:UNIQUE\s+)?INDEX\s+CONCURRENTLY\s+(?:IF\s+NOT\s+EXISTS\s+)?("?)([\w$]+)\1',
+    re.IGNORECASE,
+)
+
+
+# ── SQL Parsing ───────────────────────────────────────────────────────────────
+def split_statements(sql: str) -> list[str]:
+    """
+    Splits a SQL script on top-level semicolons.
+    Semicolons inside comments (including nested /* /* */ */), quoted
+    strings/identifiers, E'...' strings with backslash escapes and
+    dollar-quoted bodies ($$ ... $$) are not treated as separators.
+    Comments are dropped. Plain '...' strings follow
+    standard_conforming_strings (on by default): backslash is literal.
+    """
+    statements, buf = [], []
+    i, n = 0, len(sql)
+
+    def flush():
+        statement = "".join(buf).strip()
+        if statement:
+            statements.append(statement)
+        buf.clear()
+
+    while i < n:
+        c = sql[i]
+
+        if sql.startswith("--", i):                     # line comment
+            end = sql.find("\n", i)
+            i = n if end == -1 else end
+        elif sql.startswith("/*", i):                   # block comment, may nest
+            depth, i = 1, i + 2
+            while i < n and depth:
+                if sql.startswith("/*", i):
+                    depth, i = depth + 1, i + 2
+                elif sql.startswith("*/", i):
+                    depth, i = depth - 1, i + 2
+                else:
+                    i += 1
+            buf.append(" ")
+        elif (c in "eE" and sql.startswith("'", i + 1)
+              and (i == 0 or not (sql[i - 1].isalnum() or sql[i - 1] in "_$"))):
+            j = i + 2                                   # E'string' with \ escapes
+            while j < n:
+                if sql[j] == "\\":
+                    j += 2
+                    continue
+                if sql[j] == "'":
+                    if sql.startswith("''", j):
+                        j += 2
+                        continue
+                    break
+                j += 1
+            buf.append(sql[i:j + 1])
+            i = j + 1
+        elif c in ("'", '"'):                           # 'string' / "identifier"
+            j = i + 1
+            while j < n:
+                if sql[j] == c:
+                    if sql.startswith(c * 2, j):        # escaped quote
+                        j += 2
+                        continue
+                    break
+                j += 1
+            buf.append(sql[i:j + 1])
+            i = j + 1
+        elif c == "$" and _DOLLAR_TAG.match(sql, i):    # $tag$ ... $tag$
+            tag = _DOLLAR_TAG.match(sql, i).group(0)
+            end = sql.find(tag, i + len(tag))
+            end = n if end == -1 else end + len(tag)
+            buf.append(sql[i:end])
+            i = end
+        elif c == ";":
+            flush()
+            i += 1
+        else:
+            buf.append(c)
+            i += 1
+
+    flush()
+    return statements
+
+
+# ── Discovery ─────────────────────────────────────────────────────────────────
+def load_migrations() -> list[tuple[str, str]]:
+    """Returns [(version, sql)] sorted by version, e.g. ("0002_anime_indexes", ...)."""
+    migrations = []
+    for name in os.listdir(MIGRATIONS_DIR):
+        match = _FILENAME.match(name)
+        if not match:
+            continue
+        with open(os.path.join(MIGRATIONS_DIR, name), "r") as f:
+            migrations.append((int(match.group(1)), name[:-4], f.read()))
+
+    migrations.sort()
+    return [(version, sql) for _, version, sql in migrations]
+
+
+def applied_versions(conn) -> set:
+    from sqlalchemy import text
+
+    exists = conn.execute(text("SELECT to_regclass('schema_migrations')")).scalar()
+    if exists is None:
+        return set()
+    return set(conn.execute(text("SELECT version FROM schema_migrations")).scalars())
+
+
+# ── Apply ─────────────────────────────────────────────────────────────────────
+def concurrent_index_names(statements: list[str]) -> list[str]:
+    """Index names created by the CREATE INDEX CONCURRENTLY statements given."""
+    return [m.group(2) for m in map(_CONCURRENT_INDEX.match, statements) if m]
+
+
+def _drop_invalid_indexes(conn, names: list[str]):
+    """
+    A failed CREATE INDEX CONCURRENTLY leaves an INVALID index behind, which
+    IF NOT EXISTS would then skip forever. Drop those so the retry rebuilds.
+    Only `names` — the indexes the migration being applied builds — are
+    considered: an index another session is building right now is also
+    invalid, and must be left alone.
+    """
+    from sqlalchemy import text
+
+    if not names:
+        return
+
+    invalid = conn.execute(text("""
+        SELECT c.relname
+        FROM pg_index i
+        JOIN pg_class c     ON c.oid = i.indexrelid
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE NOT i.indisvalid
+          AND n.nspname = current_schema()
+          AND c.relname = ANY(:names)
+    """), {"names": names}).scalars().all()
+
+    for name in invalid:
+        print(f"[migrations] Dropping invalid index {name} left by a failed build.")
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+
+def _apply(engine, lock_conn, version: str, sql: str):
+    from sqlalchemy import text
+
+    statements = split_statements(sql)
+    record     = text("INSERT INTO schema_migrations (version) VALUES (:version)")
+
+    if any(_CONCURRENTLY.search(statement) for statement in statements):
+        # Can't run inside a transaction — lock_conn is in autocommit mode
+        _drop_invalid_indexes(lock_conn, concurrent_index_names(statements))
+        for statement in statements:
+            lock_conn.execute(text(statement))
+        lock_conn.execute(record, {"version": version})
+    else:
+        with engine.begin() as conn:
+            conn.execute(text(f"SET LOCAL lock_timeout = '{config.MIGRATION_LOCK_TIMEOUT}'"))
+            for statement in statements:
+                conn.execute(text(statement))
+            conn.execute(record, {"version": version})
+
+    print(f"[migrations] Applied {version} ({len(statements)} statements).")
+
+
+def migrate(engine) -> list[str]:
+    """Applies pending migrations. Returns the versions applied (often none)."""
+    from sqlalchemy import text
+
+    migrations = load_migrations()
+
+    # Fast path: one read of schema_migrations, no locks on the data tables
+    with engine.connect() as conn:
+        done = applied_versions(conn)
+    if all(version in done for version, _ in migrations):
+        return []
+
+    applied = []
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": ADVISORY_LOCK_ID})
+        try:
+            lock_conn.execute(text(f"SET lock_timeout = '{config.MIGRATION_LOCK_TIMEOUT}'"))
+            lock_conn.execute(text("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version     TEXT        PRIMARY KEY,
+                    applied_at  TIMESTAMP   DEFAULT NOW()
+                )
+            """))
+
+            done = applied_versions(lock_conn)  # another runner may have finished first
+
+            for version, sql in migrations:
+                if version not in done:
+                    _apply(engine, lock_conn, version, sql)
+                    applied.append(version)
+        finally:
+            # lock_conn goes back to the pool — don't leak the DDL lock_timeout
+            # into the loader's upserts on the same connection
+            lock_conn.execute(text("RESET lock_timeout"))
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": ADVISORY_LOCK_ID})
+
+    return applied
+
+
+if __name__ == "__main__":
+    from sqlalchemy import create_engine
+
+    applied = migrate(create_engine(config.DB_URL))
+    print(f"[migrations] Applied: {', '.join(applied)}" if applied else "[migrations] Schema up to date.")
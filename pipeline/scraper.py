@@ -10,21 +10,22 @@ Automatic ingestion strategy:
 """
 
 import os
-import sys
 import json
 import time
-import requests
 from datetime import datetime, UTC
-from sqlalchemy import create_engine, text, inspect
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import config
 
+# requests / sqlalchemy are imported inside the functions that use them,
+# so importing this module (e.g. from the DAG file) stays cheap.
+
 
 # ─────────────────────────────────────────────────────────────
 # Exponential Backoff
 # ─────────────────────────────────────────────────────────────
 def api_get(url, params=None, max_retries=5):
+    import requests
+
     delay = 1
 
     for attempt in range(max_retries):
@@ -49,6 +50,8 @@ def api_get(url, params=None, max_retries=5):
 # Check Existing IDs (Watermark)
 # ─────────────────────────────────────────────────────────────
 def get_existing_ids(engine) -> set:
+    from sqlalchemy import text, inspect
+
     inspector = inspect(engine)
 
     if "anime" not in inspector.get_table_names():
@@ -183,6 +186,8 @@ def save_raw(records):
 # Main Entry
 # ─────────────────────────────────────────────────────────────
 def run():
+    from sqlalchemy import create_engine
+
     engine = create_engine(config.DB_URL)
 
     existing_ids = get_existing_ids(engine)
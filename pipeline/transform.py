@@ -12,16 +12,20 @@ Produces:
 - rejected_df
 """
 
+from __future__ import annotations
+
 import os
-import sys
 import json
 import glob
-import pandas as pd
-from datetime import datetime, UTC
+from typing import TYPE_CHECKING
 
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import config
 
+# pandas is imported inside the functions that use it,
+# so importing this module (e.g. from the DAG file) stays cheap.
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # ── Load Raw Data ─────────────────────────────────────────────────────────────
 def load_latest_raw() -> list[dict]:
@@ -45,6 +49,7 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
     Cleans and casts all columns safely.
     Works for both numeric API fields and legacy string formats.
     """
+    import pandas as pd
 
     # Standardize column existence
     expected_cols = [
@@ -85,6 +90,8 @@ def clean(df: pd.DataFrame) -> pd.DataFrame:
 
 # ── Validate ──────────────────────────────────────────────────────────────────
 def validate(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    import pandas as pd
+
     rejected_rows = []
     clean_rows = []
 
@@ -127,6 +134,8 @@ def validate(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
 
 # ── Main Entry ────────────────────────────────────────────────────────────────
 def run() -> tuple[pd.DataFrame, pd.DataFrame]:
+    import pandas as pd
+
     records = load_latest_raw()
     print(f"[transform] Raw records loaded: {len(records)}")
 
@@ -0,0 +1,112 @@
+"""
+scripts/import_budget.py
+-------------------------
+Measures cold-start import time of the pipeline modules and parse time of
+the DAG file, and fails if any of them goes over budget.
+
+Each measurement runs in a fresh interpreter, so nothing is cached between
+modules. Also fails if importing a pipeline module drags in a heavy
+dependency (pandas, sqlalchemy, requests) — those must only be imported
+when a task actually runs.
+
+Usage (from the project root):
+  python scripts/import_budget.py
+  python scripts/import_budget.py --runs 10 --module-budget-ms 30
+
+The DAG check is skipped when Airflow isn't installed; run it inside the
+scheduler container to include it:
+  docker compose exec airflow-scheduler python /opt/airflow/scripts/import_budget.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT     = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+DAG_FILE = os.path.join(ROOT, "dags", "anime_etl_dag.py")
+
+MODULES = ["pipeline.scraper", "pipeline.transform", "pipeline.loader", "pipeline.migrations"]
+HEAVY   = ["pandas", "sqlalchemy", "requests"]
+
+# Budgets: import of one pipeline module, and one DAG file parse with Airflow
+# itself already imported (that's what the scheduler's DAG processor pays).
+MODULE_BUDGET_MS = 50
+DAG_BUDGET_MS    = 500
+
+_MODULE_PROBE = """
+import json, sys, time
+t = time.perf_counter()
+import {module}
+ms = (time.perf_counter() - t) * 1000
+print(json.dumps({{"ms": ms, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+_DAG_PROBE = """
+import json, time, runpy
+import airflow
+from airflow import DAG
+from airflow.operators.python import PythonOperator
+t = time.perf_counter()
+runpy.run_path({dag_file!r})
+print(json.dumps({{"ms": (time.perf_counter() - t) * 1000, "heavy": []}}))
+"""
+
+
+def _probe(code: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure(code: str, runs: int) -> tuple[float, list[str]]:
+    """Returns (median ms, heavy modules loaded) over `runs` fresh interpreters."""
+    results = [_probe(code) for _ in range(runs)]
+    return statistics.median(r["ms"] for r in results), results[0]["heavy"]
+
+
+def airflow_available() -> bool:
+    return subprocess.run(
+        [sys.executable, "-c", "import airflow"], capture_output=True
+    ).returncode == 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs",             type=int,   default=5)
+    parser.add_argument("--module-budget-ms", type=float, default=MODULE_BUDGET_MS)
+    parser.add_argument("--dag-budget-ms",    type=float, default=DAG_BUDGET_MS)
+    args = parser.parse_args()
+
+    failures = []
+
+    for module in MODULES:
+        ms, heavy = measure(_MODULE_PROBE.format(module=module, heavy=HEAVY), args.runs)
+        status = "ok" if ms <= args.module_budget_ms and not heavy else "FAIL"
+        print(f"[budget] import {module:<20} {ms:7.1f} ms  (budget {args.module_budget_ms:.0f})  {status}")
+        if ms > args.module_budget_ms:
+            failures.append(f"{module} took {ms:.1f} ms")
+        if heavy:
+            failures.append(f"{module} imported {', '.join(heavy)} at module level")
+
+    if airflow_available():
+        ms, _ = measure(_DAG_PROBE.format(dag_file=DAG_FILE), args.runs)
+        status = "ok" if ms <= args.dag_budget_ms else "FAIL"
+        print(f"[budget] parse  {'anime_etl_dag.py':<20} {ms:7.1f} ms  (budget {args.dag_budget_ms:.0f})  {status}")
+        if ms > args.dag_budget_ms:
+            failures.append(f"DAG parse took {ms:.1f} ms")
+    else:
+        print("[budget] parse  anime_etl_dag.py     skipped (airflow not installed)")
+
+    for f in failures:
+        print(f"[budget] over budget: {f}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
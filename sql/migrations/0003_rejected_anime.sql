@@ -0,0 +1,28 @@
+-- 0003_rejected_anime.sql
+-- ------------------------
+-- Records that failed validation, kept per run so bad data can be
+-- investigated without re-scraping. Columns mirror `anime` but are all
+-- nullable and unconstrained — invalid values are the point.
+
+
+-- ── Rejected Records ─────────────────────────────────────────────────────────
+CREATE TABLE IF NOT EXISTS rejected_anime (
+    id               BIGSERIAL   PRIMARY KEY,
+    quality_log_id   INTEGER     NOT NULL REFERENCES quality_log (id),
+    anime_id         INTEGER,
+    rank             INTEGER,
+    title            TEXT,
+    type             TEXT,
+    episodes         INTEGER,
+    score            NUMERIC,
+    members          INTEGER,
+    url              TEXT,
+    scraped_at       TIMESTAMP,
+    reasons          TEXT[]      NOT NULL,  -- reason codes, e.g. {missing_score,invalid_rank}
+    rejection_reason TEXT                   -- original detail, e.g. 'score_out_of_range(11.5)'
+);
+
+-- ── Indexes ───────────────────────────────────────────────────────────────────
+-- New, empty table — plain CREATE INDEX inside the migration's transaction is fine.
+CREATE INDEX IF NOT EXISTS idx_rejected_anime_run     ON rejected_anime (quality_log_id);
+CREATE INDEX IF NOT EXISTS idx_rejected_anime_reasons ON rejected_anime USING GIN (reasons);
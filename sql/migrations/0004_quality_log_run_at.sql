@@ -0,0 +1,8 @@
+-- 0004_quality_log_run_at.sql
+-- ----------------------------
+-- Latest-run lookups (dashboard health card, rejection trends) order
+-- quality_log by run_at. Built CONCURRENTLY: the table already exists
+-- and is read by the dashboard.
+
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_quality_log_run_at ON quality_log (run_at DESC);
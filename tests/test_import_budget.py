@@ -0,0 +1,26 @@
+"""
+tests/test_import_budget.py
+----------------------------
+Keeps pipeline imports cheap: runs the module check from
+scripts/import_budget.py (fresh interpreter per module) on every test run.
+A top-level `import pandas` in a pipeline module fails here.
+"""
+
+import importlib.util
+import os
+
+import pytest
+
+_SCRIPT = os.path.join(os.path.dirname(__file__), "..", "scripts", "import_budget.py")
+_spec   = importlib.util.spec_from_file_location("import_budget", _SCRIPT)
+budget  = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(budget)
+
+
+@pytest.mark.parametrize("module", budget.MODULES)
+def test_pipeline_module_import(module):
+    probe = budget._MODULE_PROBE.format(module=module, heavy=budget.HEAVY)
+    ms, heavy = budget.measure(probe, runs=3)
+
+    assert heavy == [], f"{module} imports {', '.join(heavy)} at module level"
+    assert ms <= budget.MODULE_BUDGET_MS, f"{module} took {ms:.1f} ms to import"
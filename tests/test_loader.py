@@ -0,0 +1,87 @@
+"""
+tests/test_loader.py
+---------------------
+Rejection-reason parsing and rejected-record preparation in
+pipeline/loader.py. No database needed.
+"""
+
+import json
+
+import pandas as pd
+
+from pipeline.loader import REJECTED_COLUMNS, insert_rejected, reason_codes, reason_counts
+
+
+def _rejected(*reasons) -> pd.DataFrame:
+    return pd.DataFrame({"rejection_reason": list(reasons)})
+
+
+def test_reason_codes_multiple():
+    codes = reason_codes(_rejected("missing_score, invalid_rank", "missing_title"))
+    assert codes.tolist() == [["missing_score", "invalid_rank"], ["missing_title"]]
+
+
+def test_reason_codes_strip_detail():
+    codes = reason_codes(_rejected("score_out_of_range(11.5), invalid_rank"))
+    assert codes.tolist() == [["score_out_of_range", "invalid_rank"]]
+
+
+def test_reason_codes_null_or_empty_is_empty_list():
+    codes = reason_codes(_rejected(None, "", float("nan")))
+    assert codes.tolist() == [[], [], []]
+
+
+def test_reason_codes_empty_dataframe():
+    assert reason_codes(pd.DataFrame()).tolist() == []
+    assert reason_codes(pd.DataFrame({"title": ["x"]})).tolist() == [[]]
+
+
+def test_reason_counts():
+    codes = reason_codes(_rejected(
+        "missing_score, invalid_rank",
+        "score_out_of_range(11.5), invalid_rank",
+        None,
+    ))
+    counts = reason_counts(codes)
+    assert counts == {"invalid_rank": 2, "missing_score": 1, "score_out_of_range": 1}
+    assert "" not in counts
+    json.dumps(counts)  # goes into quality_log.failure_reasons as-is
+
+
+def test_reason_counts_empty():
+    assert reason_counts(reason_codes(pd.DataFrame())) == {}
+
+
+class _RecordingConn:
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, statement, params=None):
+        self.calls.append((statement, params))
+
+
+def test_insert_rejected_records():
+    rejected = pd.DataFrame({
+        "anime_id":         pd.array([1, None], dtype="Int64"),
+        "title":            ["a", None],
+        "score":            [11.5, float("nan")],
+        "rejection_reason": ["score_out_of_range(11.5)", None],
+    })
+    conn = _RecordingConn()
+
+    stored = insert_rejected(rejected, reason_codes(rejected), 7, conn)
+
+    assert stored == 2
+    (statement, records), = conn.calls
+    assert str(statement).startswith("INSERT INTO rejected_anime")
+    assert set(records[0]) == set(REJECTED_COLUMNS) | {"reasons", "quality_log_id"}
+    assert records[0]["reasons"] == ["score_out_of_range"]
+    assert records[1]["reasons"] == []
+    assert records[1]["anime_id"] is None and records[1]["score"] is None
+    assert {r["quality_log_id"] for r in records} == {7}
+
+
+def test_insert_rejected_empty():
+    conn = _RecordingConn()
+    assert insert_rejected(pd.DataFrame(), reason_codes(pd.DataFrame()), 7, conn) == 0
+    assert conn.calls == []
@@ -0,0 +1,45 @@
+"""
+tests/test_migrations.py
+-------------------------
+Statement splitting and index-name parsing in pipeline/migrations.py.
+No database needed.
+"""
+
+import pytest
+
+from pipeline.migrations import concurrent_index_names, load_migrations, split_statements
+
+
+@pytest.mark.parametrize("sql, expected", [
+    ("SELECT 1; SELECT 2;",                   ["SELECT 1", "SELECT 2"]),
+    ("SELECT 'a;b''c'; SELECT 2",             ["SELECT 'a;b''c'", "SELECT 2"]),
+    ('SELECT "q;x" FROM t; SELECT 2',         ['SELECT "q;x" FROM t', "SELECT 2"]),
+    ("SELECT 1; -- a; comment\nSELECT 2",     ["SELECT 1", "SELECT 2"]),
+    ("SELECT /* a; b */ 1; SELECT 2",         ["SELECT   1", "SELECT 2"]),
+    ("SELECT /* a /* b; */ c; */ 1; SELECT 2", ["SELECT   1", "SELECT 2"]),
+    ("SELECT E'a\\';b'; SELECT 3",            ["SELECT E'a\\';b'", "SELECT 3"]),
+    ("SELECT e'a\\\\'; SELECT 3",             ["SELECT e'a\\\\'", "SELECT 3"]),
+    ("SELECT E'it''s;'; SELECT 3",            ["SELECT E'it''s;'", "SELECT 3"]),
+    ("SELECT 'a\\'; SELECT 3",                ["SELECT 'a\\'", "SELECT 3"]),   # standard string: \ is literal
+    ("SELECT type'x'; SELECT 3",              ["SELECT type'x'", "SELECT 3"]), # not an E-string
+    ("SELECT $$;$$; SELECT $fn$ a; $$ b $fn$", ["SELECT $$;$$", "SELECT $fn$ a; $$ b $fn$"]),
+    ("  ;  ; ",                               []),
+])
+def test_split_statements(sql, expected):
+    assert split_statements(sql) == expected
+
+
+def test_shipped_migrations_split():
+    counts = {version: len(split_statements(sql)) for version, sql in load_migrations()}
+    assert counts["0001_initial_schema"] == 3
+    assert counts["0002_anime_indexes"] == 4
+
+
+def test_concurrent_index_names():
+    statements = [
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_a ON anime (score DESC)",
+        'create unique index concurrently "Idx_B" on anime (rank)',
+        "CREATE INDEX idx_plain ON anime (type)",
+        "ALTER TABLE anime ADD COLUMN x INT",
+    ]
+    assert concurrent_index_names(statements) == ["idx_a", "Idx_B"]
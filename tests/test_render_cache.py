@@ -0,0 +1,42 @@
+"""
+tests/test_render_cache.py
+---------------------------
+Cache lookups in app/render_cache.py. Queries and rendering are stubbed,
+so no database is needed.
+"""
+
+import os
+
+import pytest
+
+import config
+from app import queries, render_cache
+from app.main import app
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "RENDER_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(render_cache, "_memory", {})
+    monkeypatch.setattr(render_cache, "render", lambda page: f"<{page}>")
+    return tmp_path
+
+
+def test_cold_miss_writes_page(cache_dir, monkeypatch):
+    monkeypatch.setattr(queries, "watermark_key", lambda: "K1")
+
+    with app.app_context():
+        assert render_cache.get("top") == "<top>"
+
+    assert (cache_dir / "K1" / "top.html").read_text() == "<top>"
+
+
+def test_cold_miss_skips_write_when_watermark_moved(cache_dir, monkeypatch):
+    keys = iter(["K1", "K2"])  # request reads K1, a load finishes mid-render
+    monkeypatch.setattr(queries, "watermark_key", lambda: next(keys))
+
+    with app.app_context():
+        assert render_cache.get("top") == "<top>"
+
+    assert not os.path.exists(cache_dir / "K1")
+    assert render_cache._memory == {}